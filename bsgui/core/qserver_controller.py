@@ -14,7 +14,7 @@ from .qserver_api import QServerAPI
 _logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueSnapshot:
     pending: list[dict]
     running: Optional[dict]
@@ -22,7 +22,7 @@ class QueueSnapshot:
     progress: Optional[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanParameter:
     name: str
     default: object | None = None
@@ -74,7 +74,7 @@ class PlanParameter:
         return text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlanDefinition:
     item_type: str
     name: str
@@ -2,120 +2,197 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
-from copy import deepcopy
+from collections.abc import Callable, Iterable, Mapping, MutableMapping, Sequence
 from typing import Any, Optional
 
 from .qserver_controller import PlanDefinition
 
+Coercer = Callable[[str], Any]
+
+
+# The queue only ever carries a handful of concrete types, so ABC checks are
+# answered once per type and then served from these tables.
+_IS_SEQUENCE_VALUE: dict[type, bool] = {}
+_IS_MAPPING: dict[type, bool] = {}
+
+
+def _is_sequence_value(value: Any) -> bool:
+    """Return True for non-string sequences."""
+    value_type = type(value)
+    result = _IS_SEQUENCE_VALUE.get(value_type)
+    if result is None:
+        result = isinstance(value, Sequence) and not isinstance(value, (str, bytes))
+        _IS_SEQUENCE_VALUE[value_type] = result
+    return result
+
+
+def _is_mapping(value: Any) -> bool:
+    value_type = type(value)
+    result = _IS_MAPPING.get(value_type)
+    if result is None:
+        result = isinstance(value, Mapping)
+        _IS_MAPPING[value_type] = result
+    return result
+
 
 def normalize_roi_map(
     roi_key_map: Optional[Mapping[str, Sequence[str]]],
-) -> dict[str, list[str]]:
-    normalized: dict[str, list[str]] = {}
+) -> dict[str, tuple[str, ...]]:
     if not isinstance(roi_key_map, Mapping):
-        return normalized
-    for key, values in roi_key_map.items():
-        if not isinstance(key, str):
-            continue
-        if isinstance(values, str):
-            normalized[key] = [values]
-        elif isinstance(values, Sequence) and not isinstance(values, (str, bytes)):
-            collected = [str(value) for value in values if isinstance(value, str)]
-            if collected:
-                normalized[key] = collected
-    return normalized
+        return {}
+    # Single-string values are shorthand for a one-element alias list.
+    candidates = {
+        key: (values,) if isinstance(values, str) else values
+        for key, values in roi_key_map.items()
+        if isinstance(key, str)
+    }
+    normalized = {
+        key: tuple([value for value in values if isinstance(value, str)])
+        for key, values in candidates.items()
+        if _is_sequence_value(values)
+    }
+    return {key: values for key, values in normalized.items() if values}
 
 
 def clone_item(item: Any) -> dict[str, Any]:
+    """
+    Return a copy-on-write clone of ``item``.
+
+    Only the top-level mapping and its ``kwargs`` container are copied; other
+    nested containers stay shared with the source, so code that edits them must
+    clone them first (see ``apply_item_edit``).
+    """
     if isinstance(item, MutableMapping):
-        return deepcopy(item)
+        cloned = dict(item)
+        kwargs = cloned.get("kwargs")
+        if isinstance(kwargs, Mapping):
+            cloned["kwargs"] = dict(kwargs)
+        return cloned
     return {"name": str(item)}
 
 
-def prepare_display_item(item: Mapping[str, Any] | Any, *, completed: bool = False) -> dict[str, Any]:
+def prepare_display_item(
+    item: Mapping[str, Any] | Any,
+    *,
+    completed: bool = False,
+    copy: bool = True,
+) -> dict[str, Any]:
+    """
+    Return a normalized top-level copy of ``item`` for display.
+
+    With ``copy=False`` the nested ``item`` and ``kwargs`` containers are
+    shared with ``item`` instead of copied; use it only for items whose
+    nested containers are never edited (e.g. history entries).
+    """
     if isinstance(item, Mapping):
-        normalized: dict[str, Any] = dict(item)
+        normalized: dict[str, Any] = {**item}
     else:
         normalized = {"name": str(item)}
 
+    # Queue payloads are decoded JSON, so nested containers are plain dicts;
+    # the exact type check avoids the slower ABC machinery on this hot path.
     nested_item = normalized.get("item")
-    if isinstance(nested_item, Mapping):
-        nested = dict(nested_item)
+    if isinstance(nested_item, dict):
+        nested = dict(nested_item) if copy else nested_item
         normalized["item"] = nested
         normalized.setdefault("name", nested.get("name"))
-        if "kwargs" not in normalized and isinstance(nested.get("kwargs"), Mapping):
-            normalized["kwargs"] = dict(nested["kwargs"])
+        if "kwargs" not in normalized and isinstance(nested.get("kwargs"), dict):
+            normalized["kwargs"] = dict(nested["kwargs"]) if copy else nested["kwargs"]
 
-    kwargs = normalized.get("kwargs")
-    if isinstance(kwargs, Mapping):
-        normalized["kwargs"] = dict(kwargs)
+    if copy:
+        kwargs = normalized.get("kwargs")
+        if isinstance(kwargs, dict):
+            normalized["kwargs"] = dict(kwargs)
 
     if completed:
+        # Precedence: result fields, then the item's own, then the nested item,
+        # then the "completed" default; merged in a single dict build.
+        result_fields: dict[str, Any] = {}
         result = normalized.get("result")
-        if isinstance(result, Mapping):
+        if isinstance(result, dict):
             status_from_result = result.get("status") or result.get("state")
             exit_status_from_result = result.get("exit_status")
             if status_from_result:
-                normalized["status"] = status_from_result
+                result_fields["status"] = status_from_result
             if exit_status_from_result:
-                normalized["exit_status"] = exit_status_from_result
+                result_fields["exit_status"] = exit_status_from_result
 
+        nested_fields: dict[str, Any] = {}
         nested = normalized.get("item")
-        if isinstance(nested, Mapping):
-            status_from_item = nested.get("status")
-            exit_status_from_item = nested.get("exit_status")
-            if status_from_item and "status" not in normalized:
-                normalized["status"] = status_from_item
-            if exit_status_from_item and "exit_status" not in normalized:
-                normalized["exit_status"] = exit_status_from_item
+        if isinstance(nested, dict):
+            nested_fields = {
+                key: nested[key] for key in ("status", "exit_status") if nested.get(key)
+            }
 
-        normalized.setdefault("status", "completed")
-        normalized.setdefault("state", normalized.get("status"))
+        normalized = {"status": "completed", **nested_fields, **normalized, **result_fields}
+        normalized.setdefault("state", normalized["status"])
 
     normalized.setdefault("name", "Unknown")
     return normalized
 
 
+_SENTINEL = object()
+_EMPTY_FROZENSET: frozenset[str] = frozenset()
+_NESTED_FIELD_CONTAINERS = ("kwargs", "result", "metadata", "item")
+
+# Column ids are a small fixed set, so their dotted-path splits are kept for reuse.
+_KEY_PARTS_CACHE: dict[str, tuple[str, ...]] = {}
+
+
+def _split_key(key: str) -> tuple[str, ...]:
+    parts = _KEY_PARTS_CACHE.get(key)
+    if parts is None:
+        parts = tuple(key.split(".")) if isinstance(key, str) and "." in key else (key,)
+        _KEY_PARTS_CACHE[key] = parts
+    return parts
+
+
+def _resolve_key_parts(mapping: Mapping[str, Any], key_parts: tuple[str, ...]) -> Any:
+    """Walk ``key_parts`` through ``mapping``; return ``_SENTINEL`` on a miss."""
+    current: Any = mapping
+    for part in key_parts:
+        if _is_mapping(current):
+            if part in current:
+                current = current.get(part)
+            else:
+                return _SENTINEL
+        elif _is_sequence_value(current):
+            next_value = _SENTINEL
+            for entry in current:
+                if _is_mapping(entry) and part in entry:
+                    next_value = entry.get(part)
+                    break
+            if next_value is _SENTINEL:
+                return _SENTINEL
+            current = next_value
+        else:
+            return _SENTINEL
+    return current
+
+
 def extract_item_field(item: Mapping[str, Any], key: str) -> Any:
     if not isinstance(item, Mapping):
         return None
 
-    sentinel = object()
-    key_parts = key.split(".") if isinstance(key, str) and "." in key else [key]
-
-    def resolve(mapping: Mapping[str, Any]) -> Any:
-        current: Any = mapping
-        for part in key_parts:
-            if isinstance(current, Mapping):
-                if part in current:
-                    current = current.get(part)
-                else:
-                    return sentinel
-            elif isinstance(current, Sequence) and not isinstance(current, (str, bytes)):
-                next_value = sentinel
-                for entry in current:
-                    if isinstance(entry, Mapping) and part in entry:
-                        next_value = entry.get(part)
-                        break
-                if next_value is sentinel:
-                    return sentinel
-                current = next_value
-            else:
-                return sentinel
-        return current
-
-    for candidate in (
-        item,
-        item.get("kwargs"),
-        item.get("result"),
-        item.get("metadata"),
-        item.get("item"),
-    ):
-        if isinstance(candidate, Mapping):
-            value = resolve(candidate)
-            if value is not sentinel:
-                return value
+    key_parts = _split_key(key)
+    if len(key_parts) == 1:
+        # Plain keys (every built-in column id) need no path walk.
+        if key in item:
+            return item.get(key)
+        for container_key in _NESTED_FIELD_CONTAINERS:
+            if isinstance(candidate := item.get(container_key), Mapping) and key in candidate:
+                return candidate.get(key)
+        return None
+
+    if (value := _resolve_key_parts(item, key_parts)) is not _SENTINEL:
+        return value
+    # Nested containers are only fetched when the previous ones missed.
+    for container_key in _NESTED_FIELD_CONTAINERS:
+        if (
+            isinstance(candidate := item.get(container_key), Mapping)
+            and (value := _resolve_key_parts(candidate, key_parts)) is not _SENTINEL
+        ):
+            return value
 
     return None
 
@@ -123,14 +200,17 @@ def extract_item_field(item: Mapping[str, Any], key: str) -> Any:
 def lookup_roi_value(
     column_id: str,
     item: Mapping[str, Any],
-    roi_key_map: Mapping[str, list[str]],
+    roi_key_map: Mapping[str, tuple[str, ...]],
     *,
     include_key: bool = False,
-    available_params: Optional[set[str]] = None,
+    available_params: Optional[frozenset[str]] = None,
 ) -> Any:
-    candidates = roi_key_map.get(column_id, [])
+    candidates = roi_key_map.get(column_id, ())
     if not candidates:
         return None
+    # First candidate the plan declares; used when no mapping holds a value.
+    params = available_params or _EMPTY_FROZENSET
+    declared = next((candidate for candidate in candidates if candidate in params), None) if params else None
 
     def _check_mapping(mapping: Mapping[str, Any]) -> Any:
         for candidate in candidates:
@@ -138,10 +218,8 @@ def lookup_roi_value(
                 value = mapping.get(candidate)
                 if value is not None:
                     return (value, candidate) if include_key else value
-        if available_params is not None:
-            for candidate in candidates:
-                    if candidate in available_params:
-                        return (None, candidate) if include_key else None
+        if declared is not None:
+            return (None, declared) if include_key else None
         return None
 
     kwargs = item.get("kwargs")
@@ -162,22 +240,33 @@ def lookup_roi_value(
         value = extract_item_field(item, candidate)
         if value is not None:
             return (value, candidate) if include_key else value
-    if available_params is not None:
-        for candidate in candidates:
-            if candidate in available_params:
-                return (None, candidate) if include_key else None
+    if declared is not None:
+        return (None, declared) if include_key else None
 
     return None
 
 
+# One-based row labels, grown on demand and reused across refreshes.
+_INDEX_LABELS: list[str] = []
+
+
+def _index_label(row_index: int) -> str:
+    if row_index < 0:
+        return str(row_index + 1)
+    labels = _INDEX_LABELS
+    while len(labels) <= row_index:
+        labels.append(str(len(labels) + 1))
+    return labels[row_index]
+
+
 def resolve_queue_value(
     column_id: str,
     item: Mapping[str, Any],
     row_index: int,
     *,
-    roi_key_map: Mapping[str, list[str]],
-    roi_value_aliases: set[str],
-    available_params: Optional[set[str]] = None,
+    roi_key_map: Mapping[str, tuple[str, ...]],
+    roi_value_aliases: frozenset[str],
+    available_params: Optional[frozenset[str]] = None,
     running = False,
 ) -> tuple[str, Optional[str]]:
 
@@ -185,7 +274,7 @@ def resolve_queue_value(
     #     print(f"resolve_queue_value: {column_id=},\n {item=},\n {row_index=},\n {roi_key_map=},\n {roi_value_aliases=},\n {available_params=},\n {running=}")
 
     if column_id == "index":
-        return str(row_index + 1), None
+        return _index_label(row_index), None
     if column_id in roi_key_map:
         roi_value = lookup_roi_value(
             column_id,
@@ -199,62 +288,142 @@ def resolve_queue_value(
             # print(f"roi_value: {roi_value}")
             return format_scalar(value), key or column_id
     if column_id == "name":
-        value = extract_item_field(item, "name") or item.get("name") or "Unknown"
+        # extract_item_field already checks item["name"] first.
+        value = extract_item_field(item, "name")
+        if value is None:
+            value = "Unknown"
         return str(value), "name"
 
     kwargs = item.get("kwargs") if isinstance(item, Mapping) else None
     if isinstance(kwargs, Mapping) and column_id in kwargs:
         return format_scalar(kwargs.get(column_id)), column_id
 
+    handler = _COLUMN_HANDLERS.get(column_id)
+    if handler is not None:
+        resolved = handler(column_id, item, running)
+        if resolved is not None:
+            return resolved
+
     value = extract_item_field(item, column_id)
-    if column_id in {"plan", "name"}:
-        return str(value or item.get("name") or "Unknown"), column_id
-    if column_id in {"state", "status"}:
-        if item.get("result", None) is not None:
-            if item.get("result").get("exit_status", None) is not None:
-                status = item.get("result").get("exit_status")
-        elif item.get("status", None) is not None:
-            status = item.get("status") 
-        elif running:
-            status = "Running"
-        else:
-            status = "Pending"
-        return status, column_id
-    if column_id == "scan_ids":
-        if item.get("result", None) is not None:
-            if item.get("result").get("scan_ids", None) is not None:
-                scan_ids = item.get("result").get("scan_ids")
-                return format_sequence(scan_ids), column_id
-        return "", column_id
-    if column_id in {"uid", "item_uid"}:
-        uid = value or item.get("item_uid") or item.get("uid")
-        return str(uid or ""), column_id
-    if column_id == "args":
-        args = value or item.get("args") or []
-        return format_sequence(args), column_id
-    if column_id == "kwargs":
-        kwargs = value or item.get("kwargs") or {}
-        if isinstance(kwargs, Mapping):
-            text = ", ".join(f"{key}={format_scalar(val)}" for key, val in kwargs.items())
-            return text, None
-    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+    if _is_sequence_value(value):
         return format_sequence(value), column_id
-    if isinstance(value, Mapping):
-        text = ", ".join(f"{key}={format_scalar(val)}" for key, val in value.items())
-        return text, column_id
+    if _is_mapping(value):
+        return format_mapping(value), column_id
     if value is None:
         fallback = item.get(column_id)
-        if isinstance(fallback, Sequence) and not isinstance(fallback, (str, bytes)):
+        if _is_sequence_value(fallback):
             return format_sequence(fallback), column_id
-        if isinstance(fallback, Mapping):
-            text = ", ".join(f"{key}={format_scalar(val)}" for key, val in fallback.items())
-            return text, column_id
+        if _is_mapping(fallback):
+            return format_mapping(fallback), column_id
         if fallback is None:
             return "", column_id
         return format_scalar(fallback), column_id
     return format_scalar(value), column_id
 
 
+def resolve_queue_row(
+    column_ids: Iterable[str],
+    item: Mapping[str, Any],
+    row_index: int,
+    *,
+    roi_key_map: Mapping[str, tuple[str, ...]],
+    roi_value_aliases: frozenset[str],
+    available_params: Optional[frozenset[str]] = None,
+    running: bool = False,
+) -> dict[str, tuple[str, Optional[str]]]:
+    """Resolve several columns of one item, reading its kwargs only once."""
+    kwargs = item.get("kwargs")
+    if not isinstance(kwargs, Mapping):
+        kwargs = {}
+    resolved: dict[str, tuple[str, Optional[str]]] = {}
+    for column_id in column_ids:
+        # Mirrors the kwargs fast path of resolve_queue_value for plain columns.
+        if column_id in kwargs and column_id not in roi_key_map and column_id not in ("index", "name"):
+            resolved[column_id] = (format_scalar(kwargs.get(column_id)), column_id)
+            continue
+        resolved[column_id] = resolve_queue_value(
+            column_id,
+            item,
+            row_index,
+            roi_key_map=roi_key_map,
+            roi_value_aliases=roi_value_aliases,
+            available_params=available_params,
+            running=running,
+        )
+    return resolved
+
+
+def _resolve_plan_column(column_id: str, item: Mapping[str, Any], running: bool) -> tuple[str, Optional[str]]:
+    value = extract_item_field(item, column_id)
+    if value is None:
+        value = item.get("name")
+    if value is None:
+        value = "Unknown"
+    return str(value), column_id
+
+
+def _resolve_status_column(column_id: str, item: Mapping[str, Any], running: bool) -> tuple[str, Optional[str]]:
+    result = item.get("result")
+    exit_status = result.get("exit_status") if isinstance(result, Mapping) else None
+    if exit_status is not None:
+        status = exit_status
+    elif item.get("status") is not None:
+        status = item.get("status")
+    elif running:
+        status = "Running"
+    else:
+        status = "Pending"
+    return status, column_id
+
+
+def _resolve_scan_ids_column(column_id: str, item: Mapping[str, Any], running: bool) -> tuple[str, Optional[str]]:
+    result = item.get("result")
+    scan_ids = result.get("scan_ids") if isinstance(result, Mapping) else None
+    if scan_ids is not None:
+        return format_sequence(scan_ids), column_id
+    return "", column_id
+
+
+def _resolve_uid_column(column_id: str, item: Mapping[str, Any], running: bool) -> tuple[str, Optional[str]]:
+    uid = extract_item_field(item, column_id)
+    if uid is None:
+        uid = item.get("item_uid")
+    if uid is None:
+        uid = item.get("uid")
+    return ("" if uid is None else str(uid)), column_id
+
+
+def _resolve_args_column(column_id: str, item: Mapping[str, Any], running: bool) -> tuple[str, Optional[str]]:
+    args = extract_item_field(item, column_id)
+    if args is None:
+        args = ()
+    return format_sequence(args), column_id
+
+
+def _resolve_kwargs_column(
+    column_id: str, item: Mapping[str, Any], running: bool
+) -> Optional[tuple[str, Optional[str]]]:
+    kwargs = extract_item_field(item, column_id)
+    if kwargs is None:
+        kwargs = {}
+    if isinstance(kwargs, Mapping):
+        return format_mapping(kwargs), None
+    return None
+
+
+# Columns with dedicated rendering; anything else goes through the generic path.
+_COLUMN_HANDLERS: dict[str, Callable[[str, Mapping[str, Any], bool], Optional[tuple[str, Optional[str]]]]] = {
+    "plan": _resolve_plan_column,
+    "state": _resolve_status_column,
+    "status": _resolve_status_column,
+    "scan_ids": _resolve_scan_ids_column,
+    "uid": _resolve_uid_column,
+    "item_uid": _resolve_uid_column,
+    "args": _resolve_args_column,
+    "kwargs": _resolve_kwargs_column,
+}
+
+
 def apply_item_edit(
     item: MutableMapping[str, Any],
     column_id: str,
@@ -262,15 +431,16 @@ def apply_item_edit(
     *,
     plan_name: str,
     plan_definitions: Mapping[str, PlanDefinition],
-    roi_key_map: Mapping[str, list[str]],
+    roi_key_map: Mapping[str, tuple[str, ...]],
+    coercers: Optional[Mapping[tuple[str, str], Coercer]] = None,
 ) -> bool:
-    value = coerce_for_key(plan_definitions, plan_name, column_id, text_value)
+    value = coerce_for_key(plan_definitions, plan_name, column_id, text_value, coercers=coercers)
 
     if set_if_exists(item, column_id, value):
         return True
 
     kwargs = item.get("kwargs")
-    if isinstance(kwargs, MutableMapping) and column_id in kwargs:
+    if isinstance(kwargs, dict) and column_id in kwargs:
         kwargs[column_id] = value
         return True
 
@@ -286,25 +456,32 @@ def apply_item_edit(
                 plan_name=plan_name,
                 plan_definitions=plan_definitions,
                 roi_key_map=roi_key_map,
+                coercers=coercers,
             ):
                 return True
         if aliases:
             container = ensure_kwargs_container(item)
             alias = aliases[0]
-            container[alias] = coerce_for_key(plan_definitions, plan_name, alias, text_value)
+            container[alias] = coerce_for_key(plan_definitions, plan_name, alias, text_value, coercers=coercers)
             return True
         return False
 
     for nested_key in ("item", "metadata", "result"):
         nested = item.get(nested_key)
-        if isinstance(nested, MutableMapping) and apply_item_edit(
+        if not isinstance(nested, dict):
+            continue
+        # Nested containers may be shared with the source snapshot; edit a clone.
+        nested = clone_item(nested)
+        if apply_item_edit(
             nested,
             column_id,
             text_value,
             plan_name=plan_name,
             plan_definitions=plan_definitions,
             roi_key_map=roi_key_map,
+            coercers=coercers,
         ):
+            item[nested_key] = nested
             return True
 
     container = ensure_kwargs_container(item)
@@ -321,7 +498,7 @@ def set_if_exists(mapping: MutableMapping[str, Any], key: str, value: Any) -> bo
 
 def ensure_kwargs_container(item: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
     kwargs = item.get("kwargs")
-    if not isinstance(kwargs, MutableMapping):
+    if not isinstance(kwargs, dict):
         kwargs = {}
         item["kwargs"] = kwargs
     return kwargs
@@ -332,7 +509,12 @@ def coerce_for_key(
     plan_name: str,
     key: str,
     text_value: str,
+    *,
+    coercers: Optional[Mapping[tuple[str, str], Coercer]] = None,
 ) -> Any:
+    if coercers is not None:
+        coercer = coercers.get((plan_name, key))
+        return coercer(text_value) if coercer is not None else text_value
     definition = plan_definitions.get(plan_name)
     if definition is not None:
         for parameter in definition.parameters:
@@ -341,6 +523,15 @@ def coerce_for_key(
     return text_value
 
 
+def build_coercer_map(plan_definitions: Mapping[str, PlanDefinition]) -> dict[tuple[str, str], Coercer]:
+    """Map ``(plan_name, parameter_name)`` to the parameter's ``coerce`` method."""
+    return {
+        (plan_name, parameter.name): parameter.coerce
+        for plan_name, definition in plan_definitions.items()
+        for parameter in definition.parameters or ()
+    }
+
+
 def build_update_payload(
     raw_item: Mapping[str, Any],
     row_values: Mapping[str, str],
@@ -383,16 +574,20 @@ def build_update_payload(
         kwargs.pop(key, None)
     kwargs.update(updates)
 
-
-    print(f"payload: {payload}")
     return payload
 
 
 def format_scalar(value: Any) -> str:
     if value is None:
         return ""
+    if type(value) is str:
+        return value
     return str(value)
 
 
 def format_sequence(value: Iterable[Any]) -> str:
-    return ", ".join(str(entry) for entry in value)
+    return ", ".join([entry if type(entry) is str else str(entry) for entry in value])
+
+
+def format_mapping(value: Mapping[Any, Any]) -> str:
+    return ", ".join([f"{key}={'' if val is None else val}" for key, val in value.items()])
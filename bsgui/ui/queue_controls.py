@@ -4,26 +4,57 @@ from __future__ import annotations
 
 from typing import Callable, Mapping, Optional, Sequence
 
-from PySide6.QtCore import QEvent, QObject, Qt
-from PySide6.QtGui import QDropEvent
-from PySide6.QtWidgets import QAbstractItemView, QTableWidget
+from PySide6.QtCore import QObject, Qt
+from PySide6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
+from PySide6.QtWidgets import QAbstractItemView, QTableView
 from shiboken6 import Shiboken
 
 from ..core.qserver_controller import QServerController
 from .status_bus import emit_status
 
-QUEUE_ITEM_UID_ROLE = Qt.ItemDataRole.UserRole + 1
-QUEUE_ITEM_STATE_ROLE = Qt.ItemDataRole.UserRole + 2
-QUEUE_ITEM_COLUMN_ROLE = Qt.ItemDataRole.UserRole + 3
 QUEUE_ITEM_STATE_PENDING = "pending"
 
 
+class QueueTableView(QTableView):
+    """Queue table that hands drag and drop events to its cursor controller."""
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._cursor_controller: Optional[QueueTableCursorController] = None
+
+    def set_cursor_controller(self, controller: Optional[QueueTableCursorController]) -> None:
+        self._cursor_controller = controller
+
+    def dragEnterEvent(self, event: QDragEnterEvent) -> None:  # noqa: N802
+        if self._cursor_controller is not None:
+            self._cursor_controller.capture_pending_drag()
+        super().dragEnterEvent(event)
+
+    def dragMoveEvent(self, event: QDragMoveEvent) -> None:  # noqa: N802
+        if self._cursor_controller is not None:
+            self._cursor_controller.capture_pending_drag()
+        super().dragMoveEvent(event)
+
+    def dropEvent(self, event: QDropEvent) -> None:  # noqa: N802
+        controller = self._cursor_controller
+        if controller is None:
+            super().dropEvent(event)
+            return
+        controller.process_pending_reorder(event)
+        # Row order comes from the queue server; don't let Qt move the cells.
+        event.setDropAction(Qt.IgnoreAction)
+        event.accept()
+        self.stopAutoScroll()
+        self.setState(QAbstractItemView.NoState)
+        self.viewport().update()
+
+
 class QueueTableCursorController(QObject):
     """Attach drag-and-drop helpers to the queue table."""
 
     def __init__(
         self,
-        table: QTableWidget,
+        table: QTableView,
         *,
         controller: Optional[QServerController] = None,
         refresh_callback: Optional[Callable[[str, int], None]] = None,
@@ -36,12 +67,15 @@ class QueueTableCursorController(QObject):
 
         self._pending_uids: list[str] = []
         self._pending_row_count = 0
+        self._row_uids: list[str] = []
+        self._row_states: list[str] = []
         self._pending_drop_row: Optional[int] = None
         self._pending_drag_uid: Optional[str] = None
         self._drag_enabled = False
 
         self._configure_table_widget()
-        table.viewport().installEventFilter(self)
+        if isinstance(table, QueueTableView):
+            table.set_cursor_controller(self)
         table.destroyed.connect(self._handle_table_destroyed)
 
     # ------------------------------------------------------------------ #
@@ -57,6 +91,11 @@ class QueueTableCursorController(QObject):
         self._pending_row_count = len(self._pending_uids)
         self._update_drag_state()
 
+    def sync_rows(self, uids: Sequence[str], states: Sequence[str]) -> None:
+        """Cache the UID and state rendered in each table row."""
+        self._row_uids = list(uids)
+        self._row_states = list(states)
+
     def has_selection(self) -> bool:
         """Return True if any queue rows are currently selected."""
         return bool(self._gather_selected_rows())
@@ -78,57 +117,35 @@ class QueueTableCursorController(QObject):
         return pending_uids
 
     # ------------------------------------------------------------------ #
-    # Qt hooks
+    # Drag and drop hooks (called by QueueTableView)
 
-    def eventFilter(self, obj: QObject, event: QEvent) -> bool:  # noqa: N802
-        table = self._table
-        if table is None or not Shiboken.isValid(table):
-            return False
-
-        viewport = table.viewport() if Shiboken.isValid(table) else None
-        if obj is viewport:
-            if event.type() in {QEvent.DragEnter, QEvent.DragMove}:
-                self._capture_pending_drag()
-            elif event.type() == QEvent.Drop:
-                drop_event = event if isinstance(event, QDropEvent) else None
-                self._process_pending_reorder(drop_event)
-        return super().eventFilter(obj, event)
-
-    # ------------------------------------------------------------------ #
-    # Internal helpers
-
-    def _configure_table_widget(self) -> None:
+    def capture_pending_drag(self) -> None:
         table = self._table
         if table is None or not Shiboken.isValid(table):
+            self._pending_drag_uid = None
             return
-        table.setSelectionBehavior(QAbstractItemView.SelectRows)
-        table.setSelectionMode(QAbstractItemView.ExtendedSelection)
-        table.setDragDropOverwriteMode(False)
-        table.setDropIndicatorShown(True)
-        table.setDefaultDropAction(Qt.MoveAction)
-        table.viewport().setAcceptDrops(False)
-        table.setDragDropMode(QAbstractItemView.NoDragDrop)
 
-    def _update_drag_state(self) -> None:
-        table = self._table
-        if table is None or not Shiboken.isValid(table):
-            self._drag_enabled = False
-            return
-        enabled = (
-            bool(self._controller)
-            and self._pending_row_count > 1
-            and all(uid for uid in self._pending_uids)
-        )
-        if enabled == self._drag_enabled:
+        selection = table.selectionModel()
+        row: Optional[int] = None
+        if selection is not None and selection.hasSelection():
+            indexes = selection.selectedRows()
+            if indexes:
+                # Prefer the most-recently focused row to keep drag/drop predictable
+                focused_row = table.currentIndex().row()
+                if focused_row >= 0:
+                    row = focused_row
+                else:
+                    row = indexes[0].row()
+        if row is None:
+            row = table.currentIndex().row()
+
+        if row is None or row < 0 or row >= self._pending_row_count:
+            self._pending_drag_uid = None
             return
 
-        self._drag_enabled = enabled
-        mode = QAbstractItemView.InternalMove if enabled else QAbstractItemView.NoDragDrop
-        table.setDragDropMode(mode)
-        table.viewport().setAcceptDrops(enabled)
-        table.setDefaultDropAction(Qt.MoveAction if enabled else Qt.IgnoreAction)
+        self._pending_drag_uid = self._lookup_row_uid(row)
 
-    def _process_pending_reorder(self, drop_event: Optional[QDropEvent] = None) -> None:
+    def process_pending_reorder(self, drop_event: Optional[QDropEvent] = None) -> None:
         if not self._drag_enabled:
             self._reset_pending_state()
             return
@@ -174,31 +191,39 @@ class QueueTableCursorController(QObject):
             self._refresh_callback(uid, target_row)
         self._reset_pending_state()
 
-    def _capture_pending_drag(self) -> None:
+    # ------------------------------------------------------------------ #
+    # Internal helpers
+
+    def _configure_table_widget(self) -> None:
         table = self._table
         if table is None or not Shiboken.isValid(table):
-            self._pending_drag_uid = None
             return
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        table.setDragDropOverwriteMode(False)
+        table.setDropIndicatorShown(True)
+        table.setDefaultDropAction(Qt.MoveAction)
+        table.viewport().setAcceptDrops(False)
+        table.setDragDropMode(QAbstractItemView.NoDragDrop)
 
-        selection = table.selectionModel()
-        row: Optional[int] = None
-        if selection is not None and selection.hasSelection():
-            indexes = selection.selectedRows()
-            if indexes:
-                # Prefer the most-recently focused row to keep drag/drop predictable
-                focused_row = table.currentRow()
-                if focused_row is not None and focused_row >= 0:
-                    row = focused_row
-                else:
-                    row = indexes[0].row()
-        if row is None:
-            row = table.currentRow()
-
-        if row is None or row < 0 or row >= self._pending_row_count:
-            self._pending_drag_uid = None
+    def _update_drag_state(self) -> None:
+        table = self._table
+        if table is None or not Shiboken.isValid(table):
+            self._drag_enabled = False
+            return
+        enabled = (
+            bool(self._controller)
+            and self._pending_row_count > 1
+            and all(uid for uid in self._pending_uids)
+        )
+        if enabled == self._drag_enabled:
             return
 
-        self._pending_drag_uid = self._lookup_row_uid(row)
+        self._drag_enabled = enabled
+        mode = QAbstractItemView.InternalMove if enabled else QAbstractItemView.NoDragDrop
+        table.setDragDropMode(mode)
+        table.viewport().setAcceptDrops(enabled)
+        table.setDefaultDropAction(Qt.MoveAction if enabled else Qt.IgnoreAction)
 
     def _derive_drop_row(self, event: QDropEvent) -> Optional[int]:
         table = self._table
@@ -215,7 +240,7 @@ class QueueTableCursorController(QObject):
             return row
 
         if pos.y() > table.viewport().rect().bottom():
-            row_count = table.rowCount()
+            row_count = table.model().rowCount()
             return row_count - 1 if row_count else None
         return None
 
@@ -227,33 +252,20 @@ class QueueTableCursorController(QObject):
         return max(0, min(self._pending_drop_row, self._pending_row_count - 1))
 
     def _lookup_row_uid(self, row: int) -> Optional[str]:
-        uid, _ = self._lookup_row_uid_and_state(row)
-        return uid
+        return (self._row_uids[row] or None) if 0 <= row < len(self._row_uids) else None
 
     def _lookup_row_uid_and_state(self, row: int) -> tuple[Optional[str], Optional[str]]:
-        table = self._table
-        if table is None or not Shiboken.isValid(table):
-            return None, None
-        if row < 0 or row >= table.rowCount():
+        uid = self._lookup_row_uid(row)
+        if uid is None:
             return None, None
-        for column in range(table.columnCount()):
-            item = table.item(row, column)
-            if item is None:
-                continue
-            uid = item.data(QUEUE_ITEM_UID_ROLE)
-            state = item.data(QUEUE_ITEM_STATE_ROLE)
-            uid_str = str(uid) if isinstance(uid, str) and uid else None
-            state_str = str(state) if isinstance(state, str) else None
-            if uid_str:
-                return uid_str, state_str
-        return None, None
+        return uid, self._row_states[row]
 
     def _current_uid(self) -> Optional[str]:
         table = self._table
         if table is None or not Shiboken.isValid(table):
             return None
-        row = table.currentRow()
-        if row is None or row < 0:
+        row = table.currentIndex().row()
+        if row < 0:
             return None
         return self._lookup_row_uid(row)
 
@@ -266,6 +278,8 @@ class QueueTableCursorController(QObject):
         self._controller = None
         self._pending_uids = []
         self._pending_row_count = 0
+        self._row_uids = []
+        self._row_states = []
         self._pending_drop_row = None
         self._pending_drag_uid = None
         self._drag_enabled = False
@@ -295,7 +309,7 @@ class QueueTableCursorController(QObject):
         rows: set[int] = set()
         if selection is not None and selection.hasSelection():
             rows.update(index.row() for index in selection.selectedRows())
-        current_row = table.currentRow()
-        if current_row is not None and current_row >= 0:
+        current_row = table.currentIndex().row()
+        if current_row >= 0:
             rows.add(current_row)
         return rows
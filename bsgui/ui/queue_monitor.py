@@ -2,57 +2,121 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import MutableMapping
-from copy import deepcopy
 from dataclasses import dataclass
-from typing import Any, Iterable, Mapping, Optional, Sequence
+from sys import intern
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QColor, QPalette, QBrush
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QBrush, QColor, QFont, QPalette
 
 from PySide6.QtWidgets import (
     QLabel,
     QListWidget,
     QPushButton,
     QProgressBar,
-    QScrollArea,
     QSizePolicy,
-    QTableWidget,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 from PySide6.QtWidgets import QAbstractItemView, QGridLayout, QHeaderView
 
-from .queue_controls import QueueTableCursorController, QUEUE_ITEM_COLUMN_ROLE
+from .queue_controls import QueueTableCursorController, QueueTableView
+from .queue_table_model import QueueRow, QueueTableModel
 from .status_bus import emit_status
 
-QUEUE_ITEM_UID_ROLE = Qt.ItemDataRole.UserRole + 1
-QUEUE_ITEM_STATE_ROLE = Qt.ItemDataRole.UserRole + 2
 QUEUE_ITEM_STATE_PENDING = "pending"
 QUEUE_ITEM_STATE_COMPLETED = "completed"
 QUEUE_ITEM_STATE_RUNNING = "running"
-QUEUE_ITEM_KWARG_KEY_ROLE = Qt.ItemDataRole.UserRole + 4
+_NO_PARAMETERS: frozenset[str] = frozenset()
+# Marks "no running item received yet", which is distinct from ``None``.
+_NO_SOURCE: Any = object()
+# Header labels derived from kwarg keys, shared by every monitor instance.
+_LABEL_CACHE: dict[str, str] = {}
+
+_logger = logging.getLogger(__name__)
 
 from ..core.qserver_controller import PlanDefinition, QServerController, QueueSnapshot
 from ..core.queue_item_utils import (
+    Coercer,
     apply_item_edit,
+    build_coercer_map,
     build_update_payload,
     clone_item,
     extract_item_field,
     normalize_roi_map,
     prepare_display_item,
+    resolve_queue_row,
     resolve_queue_value,
 )
 
 
-@dataclass(frozen=True)
+def _column_label(key: str) -> str:
+    label = _LABEL_CACHE.get(key)
+    if label is None:
+        label = _LABEL_CACHE[key] = key.replace("_", " ").title()
+    return label
+
+
+@dataclass(frozen=True, slots=True)
 class QueueColumnSpec:
     column_id: str
     label: str
     stretch: bool = False
 
 
+@dataclass(frozen=True, slots=True)
+class _QueueActionState:
+    """Queue server flags that drive the start/stop buttons, read together."""
+
+    running: bool
+    re_closed: bool
+    stop_pending: bool
+
+
+@dataclass(frozen=True, slots=True)
+class _PreparedSnapshot:
+    """Pending/completed lists built off the UI thread for one snapshot."""
+
+    pending_base: Optional[list[Mapping[str, Any]]]
+    completed_base: Optional[list[Mapping[str, Any]]]
+    # Plan definitions generation the display items were carried over for.
+    plan_generation: int
+    # ``None`` when the list equals its base and nothing needs installing.
+    pending: Optional[tuple[list[Mapping[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]]
+    completed: Optional[tuple[list[Mapping[str, Any]], list[dict[str, Any]]]]
+
+
+class _SnapshotPrepSignals(QObject):
+    prepared = Signal(int, object, object)
+
+
+class _SnapshotPrepRunnable(QRunnable):
+    """
+    Run snapshot preparation on the global thread pool.
+
+    The owner keeps the runnable (and with it ``signals``) alive until the
+    result has been delivered, so auto-deletion is turned off.
+    """
+
+    def __init__(self, generation: int, snapshot: QueueSnapshot, job: Callable[[], _PreparedSnapshot]) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _SnapshotPrepSignals()
+        self.generation = generation
+        self._snapshot = snapshot
+        self._job = job
+
+    def run(self) -> None:
+        try:
+            prepared: Optional[_PreparedSnapshot] = self._job()
+        except Exception:  # pragma: no cover - fall back to the UI thread
+            _logger.exception("Error preparing queue snapshot")
+            prepared = None
+        self.signals.prepared.emit(self.generation, self._snapshot, prepared)
+
+
 class QueueMonitorWidget(QWidget):
     """Widget that displays queue state and progress for Bluesky QServer."""
 
@@ -67,24 +131,65 @@ class QueueMonitorWidget(QWidget):
         super().__init__(parent)
 
         self._controller: Optional[QServerController] = None
+        # Queue API of the current controller, resolved once in set_controller.
+        self._api: Optional[Any] = None
         self._roi_key_map = normalize_roi_map(roi_key_map)
-        self._roi_value_aliases = {
+        self._roi_value_aliases = frozenset(
             alias for values in self._roi_key_map.values() for alias in values if alias != "title"
+        )
+        # Header labels given by the ``columns`` option, keyed by column id;
+        # they replace the derived labels so no formatting is needed for them.
+        self._label_overrides: dict[str, str] = {
+            str(entry["id"]): str(entry["label"])
+            for entry in columns or ()
+            if isinstance(entry, Mapping) and entry.get("id") and entry.get("label")
         }
 
-        self._columns: list[QueueColumnSpec] = []
+        self._columns: tuple[QueueColumnSpec, ...] = tuple(self._base_columns())
+        self._known_column_ids: set[str] = {spec.column_id for spec in self._columns}
+        # Column ids in display order, refreshed whenever ``_columns`` grows.
+        self._column_ids: tuple[str, ...] = tuple(spec.column_id for spec in self._columns)
+        # Column specs last pushed to the header.
+        self._applied_columns: tuple[QueueColumnSpec, ...] = ()
         self._plan_definitions: dict[str, PlanDefinition] = {}
-        self._plan_param_cache: dict[str, set[str]] = {}
+        self._plan_param_cache: dict[str, frozenset[str]] = {}
+        self._coercer_cache: dict[tuple[str, str], Coercer] = {}
+        # Bumped whenever the plan definitions change; cached cells hold edit
+        # keys derived from the parameter sets of one generation.
+        self._plan_generation = 0
         self._pending_raw_items: list[dict[str, Any]] = []
         self._pending_items: list[dict[str, Any]] = []
+        self._pending_uid_index: dict[str, int] = {}
         self._completed_items: list[dict[str, Any]] = []
         self._running_item: dict[str, Any] = {}
+        # Last pending/completed sequences received, used to skip unchanged polls.
+        self._last_pending_source: Optional[list[Mapping[str, Any]]] = None
+        self._last_completed_source: Optional[list[Mapping[str, Any]]] = None
+        self._last_running_source: Any = _NO_SOURCE
         self._queue_controls: Optional[QueueTableCursorController] = None
-        self._suppress_item_changed = False
         self._pending_table_refresh = False
+        self._pending_snapshot: Optional[QueueSnapshot] = None
+        # Bumped per snapshot handed to the thread pool; older results are dropped.
+        self._snapshot_generation = 0
+        # Preparation still running, if any, held until its result arrives.
+        # Only one runs at a time; snapshots arriving meanwhile wait in
+        # ``_pending_snapshot``.
+        self._snapshot_job: Optional[_SnapshotPrepRunnable] = None
+        # Refresh requests re-arm this timer, so a burst of updates results in
+        # a single table rebuild once things settle.
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(40)
+        self._rebuild_timer.timeout.connect(self._flush_queue_table)
         self._has_active_plan = False
-
-        self._queue_table = QTableWidget(0, 0)
+        self._column_resize_mode = QHeaderView.Interactive
+        # Fixed-height rows: stretching them makes every row insert or removal
+        # recompute all section sizes.
+        self._row_resize_mode = QHeaderView.Fixed
+
+        self._queue_model = QueueTableModel(self)
+        self._queue_table = QueueTableView()
+        self._queue_table.setModel(self._queue_model)
         self._queue_table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self._queue_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self._queue_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
@@ -96,7 +201,7 @@ class QueueMonitorWidget(QWidget):
             controller=None,
             refresh_callback=self._handle_local_pending_reorder,
         )
-        self._queue_table.itemChanged.connect(self._handle_item_changed)
+        self._queue_model.cellEdited.connect(self._handle_cell_edited)
 
         self._active_label = QLabel("Idle")
         self._progress = QProgressBar()
@@ -106,6 +211,17 @@ class QueueMonitorWidget(QWidget):
         self._completed_list = QListWidget()
         self._completed_text_color = QColor("#5c5c5c")
         self._running_item_color = QColor("#2e7d32")
+        # Built once and shared by every cell of the matching state.
+        self._completed_brush = QBrush(self._completed_text_color)
+        self._running_brush = QBrush(self._running_item_color)
+        self._running_font = QFont(self._queue_table.font())
+        self._running_font.setBold(True)
+        self._queue_model.set_state_style(QUEUE_ITEM_STATE_COMPLETED, foreground=self._completed_brush)
+        self._queue_model.set_state_style(
+            QUEUE_ITEM_STATE_RUNNING,
+            foreground=self._running_brush,
+            font=self._running_font,
+        )
         self._start_queue_button = QPushButton("Start Queue")
         self._start_queue_button.clicked.connect(self._handle_start_queue)
         self._start_queue_button.setEnabled(True)
@@ -139,12 +255,10 @@ class QueueMonitorWidget(QWidget):
         header_layout.addWidget(self._clear_queue_button, 1, 1)
         header_layout.addWidget(self._clear_history_button, 1, 2)
         layout.addLayout(header_layout)
-        table_container = QScrollArea()
-        table_container.setWidgetResizable(True)
-        table_container.setWidget(self._queue_table)
-        layout.addWidget(table_container)
+        layout.addWidget(self._queue_table)
 
         self._status_label = QLabel("")
+        self._last_status_text = ""
         self._status_label.setObjectName("queueStatusLabel")
         self._status_label.setWordWrap(True)
         layout.addWidget(self._status_label)
@@ -171,7 +285,12 @@ class QueueMonitorWidget(QWidget):
             except (RuntimeError, AttributeError):
                 pass
         self._controller = controller
-        self._plan_param_cache.clear()
+        self._api = getattr(controller, "_api", None) if controller is not None else None
+        self._pending_snapshot = None
+        self._snapshot_generation += 1
+        self._last_pending_source = None
+        self._last_completed_source = None
+        self._last_running_source = _NO_SOURCE
         self._load_plan_definitions()
         if self._queue_controls is not None:
             self._queue_controls.set_controller(controller)
@@ -187,21 +306,131 @@ class QueueMonitorWidget(QWidget):
     # Snapshot/application helpers
 
     def _handle_queue_updated(self, snapshot: QueueSnapshot) -> None:
+        # Only the latest snapshot matters; bursts of updates collapse into a
+        # single refresh on the next event-loop iteration.
+        scheduled = self._pending_snapshot is not None
+        self._pending_snapshot = snapshot
+        if not scheduled:
+            QTimer.singleShot(0, self._flush_snapshot)
+
+    def _flush_snapshot(self) -> None:
+        if self._snapshot_job is not None:
+            # Picked up again once the running preparation reports back, so a
+            # fast poll cannot keep discarding results before they land.
+            return
+        snapshot = self._pending_snapshot
+        self._pending_snapshot = None
+        if snapshot is None:
+            return
         if not self._plan_definitions:
             self._load_plan_definitions()
-        self._apply_snapshot(snapshot)
+        # Cloning and display preparation scale with queue size, so they run on
+        # the thread pool; the results are installed back on the UI thread.
+        self._snapshot_generation += 1
+        pending_base, pending_items = self._last_pending_source, self._pending_items
+        completed_base, completed_items = self._last_completed_source, self._completed_items
+        plan_generation = self._plan_generation
+        runnable = _SnapshotPrepRunnable(
+            self._snapshot_generation,
+            snapshot,
+            lambda: self._prepare_snapshot(
+                snapshot,
+                pending_base,
+                pending_items,
+                completed_base,
+                completed_items,
+                plan_generation,
+            ),
+        )
+        runnable.signals.prepared.connect(self._handle_snapshot_prepared)
+        self._snapshot_job = runnable
+        QThreadPool.globalInstance().start(runnable)
+
+    def _prepare_snapshot(
+        self,
+        snapshot: QueueSnapshot,
+        pending_base: Optional[list[Mapping[str, Any]]],
+        pending_items: list[dict[str, Any]],
+        completed_base: Optional[list[Mapping[str, Any]]],
+        completed_items: list[dict[str, Any]],
+        plan_generation: int,
+    ) -> _PreparedSnapshot:
+        """Build the snapshot's lists without touching widget state (worker thread)."""
+        pending_source = list(snapshot.pending or [])
+        pending = None
+        if pending_source != pending_base:
+            pending = (
+                pending_source,
+                *self._prepare_pending(pending_source, pending_base, pending_items, plan_generation),
+            )
+        completed_source = list(reversed(snapshot.completed or []))
+        completed = None
+        if completed_source != completed_base:
+            completed = (
+                completed_source,
+                self._prepare_completed(completed_source, completed_base, completed_items, plan_generation),
+            )
+        return _PreparedSnapshot(pending_base, completed_base, plan_generation, pending, completed)
+
+    def _handle_snapshot_prepared(
+        self,
+        generation: int,
+        snapshot: QueueSnapshot,
+        prepared: Optional[_PreparedSnapshot],
+    ) -> None:
+        job = self._snapshot_job
+        if job is not None and job.generation == generation:
+            self._snapshot_job = None
+        if generation == self._snapshot_generation:
+            self._install_prepared_snapshot(snapshot, prepared)
+        if self._pending_snapshot is not None:
+            self._flush_snapshot()
+
+    def _install_prepared_snapshot(
+        self,
+        snapshot: QueueSnapshot,
+        prepared: Optional[_PreparedSnapshot],
+    ) -> None:
+        if (
+            prepared is None
+            or prepared.pending_base is not self._last_pending_source
+            or prepared.completed_base is not self._last_completed_source
+            or prepared.plan_generation != self._plan_generation
+        ):
+            # Preparation failed, an edit/reorder replaced the lists it was
+            # based on, or the plan definitions changed while it ran; apply the
+            # snapshot directly instead.
+            self._apply_snapshot(snapshot)
+            return
+        if prepared.completed is not None:
+            self._install_completed(*prepared.completed)
+        if prepared.pending is not None:
+            self._install_pending(*prepared.pending)
+        else:
+            self._update_queue_actions()
+        self.update_active(snapshot.running, snapshot.progress)
 
     def _load_plan_definitions(self) -> None:
-        self._plan_definitions = {}
+        previous = self._plan_definitions
+        definitions: Sequence[PlanDefinition] = ()
         controller = self._controller
-        if controller is None:
-            return
-        try:
-            definitions = controller.get_allowed_plan_definitions()
-        except Exception:
-            return
+        if controller is not None:
+            try:
+                definitions = controller.get_allowed_plan_definitions()
+            except Exception:
+                definitions = ()
         self._plan_definitions = {definition.name: definition for definition in definitions}
-        self._plan_param_cache.clear()
+        # Parameter names come straight from the fetched definitions so row
+        # rendering never has to round-trip to the queue server.
+        self._plan_param_cache = {
+            name: frozenset(parameter.name for parameter in definition.parameters or ())
+            for name, definition in self._plan_definitions.items()
+        }
+        self._coercer_cache = build_coercer_map(self._plan_definitions)
+        if self._plan_definitions != previous:
+            # Rendered rows hold edit keys derived from the old parameter sets.
+            self._plan_generation += 1
+            self._refresh_queue_table()
 
     def _apply_snapshot(self, snapshot: QueueSnapshot) -> None:
         self.update_completed(snapshot.completed or [])
@@ -212,8 +441,47 @@ class QueueMonitorWidget(QWidget):
     # View helpers
 
     def update_queue(self, queue: Sequence[Mapping[str, Any]]) -> None:
-        self._pending_raw_items = [clone_item(item) for item in queue]
-        self._pending_items = [prepare_display_item(item) for item in self._pending_raw_items]
+        source = list(queue)
+        if source == self._last_pending_source:
+            self._update_queue_actions()
+            return
+        raw_items, display_items = self._prepare_pending(
+            source,
+            self._last_pending_source,
+            self._pending_items,
+            self._plan_generation,
+        )
+        self._install_pending(source, raw_items, display_items)
+
+    def _prepare_pending(
+        self,
+        source: list[Mapping[str, Any]],
+        previous_source: Optional[list[Mapping[str, Any]]],
+        previous_items: list[dict[str, Any]],
+        plan_generation: int,
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        raw_items = [clone_item(item) for item in source]
+        display_items = self._carry_over_display_items(
+            source,
+            previous_source,
+            previous_items,
+            raw_items,
+            prepare_display_item,
+            plan_generation,
+        )
+        return raw_items, display_items
+
+    def _install_pending(
+        self,
+        source: list[Mapping[str, Any]],
+        raw_items: list[dict[str, Any]],
+        display_items: list[dict[str, Any]],
+    ) -> None:
+        self._last_pending_source = source
+        self._pending_raw_items = raw_items
+        self._pending_items = display_items
+        self._reindex_pending_uids()
+        self._ensure_columns(self._pending_items)
         self._refresh_queue_table()
         self._update_queue_actions()
 
@@ -222,27 +490,94 @@ class QueueMonitorWidget(QWidget):
         item: Optional[Mapping[str, Any]],
         progress: Optional[int],
     ) -> None:
+        if item == self._last_running_source:
+            return
+        self._last_running_source = item
         self._running_item = clone_item(item)
+        self._ensure_columns([self._running_item])
         self._refresh_queue_table()
 
     def update_completed(self, completed: Sequence[Mapping[str, Any]]) -> None:
+        # Kept in display order (newest first) so no second reversed copy is needed.
+        source = list(reversed(completed))
+        if source == self._last_completed_source:
+            return
+        self._install_completed(
+            source,
+            self._prepare_completed(source, self._last_completed_source, self._completed_items, self._plan_generation),
+        )
+
+    def _prepare_completed(
+        self,
+        source: list[Mapping[str, Any]],
+        previous_source: Optional[list[Mapping[str, Any]]],
+        previous_items: list[dict[str, Any]],
+        plan_generation: int,
+    ) -> list[dict[str, Any]]:
+        # History entries are read-only, so their nested containers can be shared.
+        return self._carry_over_display_items(
+            source,
+            previous_source,
+            previous_items,
+            source,
+            lambda item: prepare_display_item(item, completed=True, copy=False),
+            plan_generation,
+        )
+
+    def _install_completed(self, source: list[Mapping[str, Any]], display_items: list[dict[str, Any]]) -> None:
+        self._last_completed_source = source
         self._completed_list.clear()
-        self._completed_items = [prepare_display_item(item, completed=True) for item in completed]
-        self._completed_items = self._completed_items[::-1]
+        self._completed_items = display_items
+        self._ensure_columns(self._completed_items)
         self._refresh_queue_table()
 
+    def _carry_over_display_items(
+        self,
+        source: Sequence[Mapping[str, Any]],
+        previous_source: Optional[Sequence[Mapping[str, Any]]],
+        previous_items: Sequence[dict[str, Any]],
+        build_from: Sequence[Mapping[str, Any]],
+        build: Callable[[Mapping[str, Any]], dict[str, Any]],
+        plan_generation: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Build display items for ``source``, reusing those of unchanged entries.
+
+        ``previous_items`` must line up with ``previous_source``. An entry whose
+        UID was shown before with an identical payload keeps its display item,
+        and with it the rendered cell cache, as long as that cache was built
+        for ``plan_generation``; everything else is rebuilt from the matching
+        element of ``build_from``.
+        """
+        reusable: dict[str, tuple[Mapping[str, Any], dict[str, Any]]] = {}
+        if previous_source is not None and len(previous_source) == len(previous_items):
+            for previous, display in zip(previous_source, previous_items):
+                if display.get("_plan_generation", plan_generation) != plan_generation:
+                    continue
+                uid = self._get_uid(previous)
+                if uid:
+                    reusable[uid] = (previous, display)
+
+        items: list[dict[str, Any]] = []
+        for item, build_item in zip(source, build_from):
+            entry = reusable.get(self._get_uid(item)) if reusable else None
+            if entry is not None and entry[0] == item:
+                items.append(entry[1])
+            else:
+                items.append(build(build_item))
+        return items
+
     def _update_queue_actions(self) -> None:
         api = self._require_queue_api(notify=False)
         if api is None:
             return
-        queue_running = api.isqueue_running()
-        re_closed = api.isRE_closed()
-        queue_stop_pending = api.queue_stop_pending()
-        if not queue_stop_pending:
-            if not re_closed and queue_running:
+        state = self._read_queue_action_state(api)
+        if not state.stop_pending:
+            re_closed = state.re_closed
+            if not re_closed and state.running:
                 self._start_queue_button.setEnabled(False)
                 self._stop_queue_button.setEnabled(True)
-            elif not re_closed and not queue_running:
+            elif not re_closed and not state.running:
                 self._start_queue_button.setEnabled(True)
                 self._stop_queue_button.setEnabled(False)
                 self._stop_queue_button.setDown(False)
@@ -251,6 +586,14 @@ class QueueMonitorWidget(QWidget):
                 self._stop_queue_button.setEnabled(False)
 
 
+    @staticmethod
+    def _read_queue_action_state(api: Any) -> _QueueActionState:
+        return _QueueActionState(
+            running=api.isqueue_running(),
+            re_closed=api.isRE_closed(),
+            stop_pending=api.queue_stop_pending(),
+        )
+
     def _handle_start_queue(self) -> None:
         button = self._start_queue_button
 
@@ -434,12 +777,11 @@ class QueueMonitorWidget(QWidget):
         When ``notify`` is True, emit a status message explaining why the API
         could not be returned (missing controller or API).
         """
-        controller = self._controller
-        if controller is None:
+        if self._controller is None:
             if notify:
                 self._set_status_message("Queue controller unavailable.")
             return None
-        api = getattr(controller, "_api", None)
+        api = self._api
         if api is None:
             if notify:
                 self._set_status_message("Queue API unavailable.")
@@ -450,16 +792,7 @@ class QueueMonitorWidget(QWidget):
         if not self._pending_items:
             return
 
-        def resolve_uid(item: Mapping[str, Any]) -> str:
-            value = extract_item_field(item, "item_uid") or extract_item_field(item, "uid")
-            return str(value or "")
-
-        source_index: Optional[int] = None
-        for idx, item in enumerate(self._pending_items):
-            if resolve_uid(item) == uid:
-                source_index = idx
-                break
-
+        source_index = self._pending_uid_index.get(uid)
         if source_index is None or target_index < 0:
             return
 
@@ -473,9 +806,23 @@ class QueueMonitorWidget(QWidget):
             target_index -= 1
         self._pending_items.insert(target_index, item)
         self._pending_raw_items.insert(target_index, raw_item)
+        self._reindex_pending_uids()
+        # The local order no longer matches the last snapshot; accept the next one.
+        self._last_pending_source = None
         self._refresh_queue_table()
 
+    def _reindex_pending_uids(self) -> None:
+        index: dict[str, int] = {}
+        for position, item in enumerate(self._pending_items):
+            uid = str(self._get_uid(item))
+            if uid:
+                index.setdefault(uid, position)
+        self._pending_uid_index = index
+
     def _refresh_queue_table(self) -> None:
+        self._rebuild_timer.start()
+
+    def _flush_queue_table(self) -> None:
         if self._queue_table.state() == QAbstractItemView.EditingState:
             if not self._pending_table_refresh:
                 self._pending_table_refresh = True
@@ -504,83 +851,153 @@ class QueueMonitorWidget(QWidget):
         else:
             all_items: list[Mapping[str, Any]] = [*self._pending_items, *self._completed_items]
         
-        self._ensure_columns(all_items)
-        self._suppress_item_changed = True
-        self._queue_table.blockSignals(True)
-        
+        # Row-invariant lookups hoisted out of the per-cell loop.
+        column_ids = self._column_ids
+        column_count = len(column_ids)
+        # Index cells depend on the row position, so whole rows can only be
+        # reused when that column is not shown.
+        reuse_rows = "index" not in column_ids
+        roi_key_map = self._roi_key_map
+        roi_value_aliases = self._roi_value_aliases
+        row_offset = 1 if running_uid else 0
+        pending_count = len(self._pending_raw_items)
+        get_uid = self._get_uid
+        extract_plan_name = self._extract_plan_name
+        plan_parameters_for = self._plan_parameters_for
+        # Parameter sets resolved once per distinct plan name in this rebuild.
+        params_by_plan: dict[str, frozenset[str]] = {}
+        cached_cells = self._cached_cells
+        plan_generation = self._plan_generation
+
+        running_key = str(running_uid)
+
+        rows: list[QueueRow] = []
+        for row, item in enumerate(all_items):
+            running = False
+            # A row rendered earlier for this very item already holds its UID.
+            cached_row = item.get("_row") if reuse_rows else None
+            uid = cached_row.uid if cached_row is not None else str(get_uid(item))
+
+            pending_index = row - row_offset
+
+            if running_uid and uid == running_key:
+                state = QUEUE_ITEM_STATE_RUNNING
+                running = True
+            elif 0 <= pending_index < pending_count:
+                state = QUEUE_ITEM_STATE_PENDING
+            else:
+                state = QUEUE_ITEM_STATE_COMPLETED
+
+            # Columns only ever grow, so a cached row with the same width and
+            # state was rendered against the current column list. Its edit keys
+            # are only valid for the plan definitions it was rendered with.
+            if (
+                cached_row is not None
+                and cached_row.state == state
+                and len(cached_row.cells) == column_count
+                and item.get("_plan_generation") == plan_generation
+            ):
+                rows.append(cached_row)
+                continue
+
+            plan_name = extract_plan_name(item)
+            param_names = params_by_plan.get(plan_name)
+            if param_names is None:
+                param_names = params_by_plan[plan_name] = plan_parameters_for(plan_name)
+            cells = cached_cells(item, state, plan_generation)
+
+            # Rows seen before are fully cached, so gather the whole row in one
+            # pass and only resolve the columns that are still missing.
+            resolved = [cells.get(column_id) for column_id in column_ids]
+            if None in resolved:
+                missing = [column_id for column_id, cached in zip(column_ids, resolved) if cached is None]
+                fresh = resolve_queue_row(
+                    missing,
+                    item,
+                    row,
+                    roi_key_map=roi_key_map,
+                    roi_value_aliases=roi_value_aliases,
+                    available_params=param_names,
+                    running=running,
+                )
+                for column_id, cached in fresh.items():
+                    if column_id != "index":
+                        cells[column_id] = cached
+                resolved = [fresh.get(column_id, cached) for column_id, cached in zip(column_ids, resolved)]
+
+            texts = tuple([display_value for display_value, _ in resolved])
+            effective_keys = [source_key or column_id for (_, source_key), column_id in zip(resolved, column_ids)]
+            kwarg_keys = tuple([key if key in param_names else None for key in effective_keys])
+            row_data = QueueRow(uid, state, texts, kwarg_keys)
+            if type(item) is dict or isinstance(item, MutableMapping):
+                item["_row"] = row_data
+            rows.append(row_data)
+
+        table = self._queue_table
+        viewport = table.viewport()
+        header = table.horizontalHeader()
+        vertical_header = table.verticalHeader()
+        sorting_enabled = table.isSortingEnabled()
+
+        # Suspend repaint, sorting and header section recomputation while the
+        # model is synchronised; everything is restored in one pass below.
+        # The viewport is a separate widget, so it is frozen explicitly.
+        table.setUpdatesEnabled(False)
+        viewport.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+
         try:
-            self._queue_table.setRowCount(len(all_items))
-            for row, item in enumerate(all_items):
-                running = False
-                uid = self._get_uid(item)
-                
-                pending_index = row - (1 if running_uid else 0)
-
-                if running_uid and uid == running_uid:
-                    state = QUEUE_ITEM_STATE_RUNNING
-                    running = True
-                elif 0 <= pending_index < len(self._pending_raw_items):
-                    state = QUEUE_ITEM_STATE_PENDING
-                else:
-                    state = QUEUE_ITEM_STATE_COMPLETED
-
-                plan_name = self._extract_plan_name(item)
-                param_names = self._plan_parameters_for(plan_name)
-
-                for column_index, spec in enumerate(self._columns):
-                    display_value, source_key = resolve_queue_value(
-                        spec.column_id,
-                        item,
-                        row,
-                        roi_key_map=self._roi_key_map,
-                        roi_value_aliases=self._roi_value_aliases,
-                        available_params=param_names,
-                        running=running,
-                    )
-
-                    cell = QTableWidgetItem(display_value)
-                    if state == QUEUE_ITEM_STATE_COMPLETED:
-                        cell.setForeground(QBrush(self._completed_text_color))
-                    if state == QUEUE_ITEM_STATE_RUNNING:
-                        cell.setForeground(QBrush(self._running_item_color))
-                        font = cell.font()
-                        font.setBold(True)
-                        cell.setFont(font)
-
-                    cell.setData(QUEUE_ITEM_UID_ROLE, str(uid))
-                    cell.setData(QUEUE_ITEM_STATE_ROLE, state)
-                    cell.setData(QUEUE_ITEM_COLUMN_ROLE, spec.column_id)
-
-                    effective_key = source_key or spec.column_id
-                    if effective_key and effective_key in param_names:
-                        cell.setData(QUEUE_ITEM_KWARG_KEY_ROLE, effective_key)
-
-                    flags = cell.flags()
-                    if state == QUEUE_ITEM_STATE_PENDING:
-                        flags |= Qt.ItemIsDragEnabled | Qt.ItemIsEditable
-                    else:
-                        flags &= ~Qt.ItemIsDragEnabled
-                        flags &= ~Qt.ItemIsEditable
-                    cell.setFlags(flags)
-
-                    self._queue_table.setItem(row, column_index, cell)
-            
+            self._queue_model.sync_rows(rows)
         finally:
-            self._queue_table.blockSignals(False)
-            self._suppress_item_changed = False
+            header.setSectionResizeMode(self._column_resize_mode)
+            vertical_header.setSectionResizeMode(self._row_resize_mode)
+            table.setSortingEnabled(sorting_enabled)
+            viewport.setUpdatesEnabled(True)
+            table.setUpdatesEnabled(True)
 
         if self._queue_controls is not None:
+            self._queue_controls.sync_rows(
+                [row_data.uid for row_data in rows],
+                [row_data.state for row_data in rows],
+            )
             self._queue_controls.sync_pending_items(self._pending_raw_items)
 
-    def _handle_item_changed(self, cell: QTableWidgetItem) -> None:
-        
-        if self._suppress_item_changed:
-            return
+    @staticmethod
+    def _cached_cells(
+        item: Mapping[str, Any],
+        state: str,
+        plan_generation: int,
+    ) -> dict[str, tuple[str, Optional[str]]]:
+        """
+        Return the per-row display cache stored on ``item``.
+
+        Display items are replaced whenever a snapshot arrives or a row is
+        edited, so caching ``column_id -> (display, source_key)`` on the item
+        itself means repeated refreshes only resolve cells for new rows. ROI
+        source keys depend on the plan parameters, so the cache is also
+        dropped when the plan definitions generation changes.
+        """
+        if type(item) is not dict and not isinstance(item, MutableMapping):
+            return {}
+        cells = item.get("_cells")
+        if (
+            not isinstance(cells, dict)
+            or item.get("_state") != state
+            or item.get("_plan_generation") != plan_generation
+        ):
+            cells = {}
+            item["_cells"] = cells
+            item["_state"] = state
+            item["_plan_generation"] = plan_generation
+        return cells
+
+    def _handle_cell_edited(self, table_row: int, column_index: int, new_text: str) -> None:
         if self._controller is None:
             return
 
-        row = cell.row()
-        column_index = cell.column()
+        row = table_row
         running_uid = self._get_uid(self._running_item)
         if running_uid != "":
             row -= 1
@@ -588,34 +1005,31 @@ class QueueMonitorWidget(QWidget):
             return
         if row >= len(self._pending_raw_items):
             # Editing completed or running row: revert.
-            self._restore_cell_from_cache(cell, row, column_index)
+            self._restore_cell_from_cache(table_row, row, column_index)
             self._set_status_message("Only queued plans can be edited.")
             return
         if column_index >= len(self._columns):
             return
 
-        column_id = cell.data(QUEUE_ITEM_COLUMN_ROLE)
-        if not isinstance(column_id, str):
-            column_id = self._columns[column_index].column_id
-
-        plan_name = self._extract_plan_name(self._pending_raw_items[row])
-        print(plan_name)
-        source_key = cell.data(QUEUE_ITEM_KWARG_KEY_ROLE)
-        target_key = source_key if isinstance(source_key, str) and source_key else column_id
-        print(f"source_key: {source_key}, target_key: {target_key}")
-        raw_item = self._pending_raw_items[row]
-        print(f"raw_item: {raw_item}")
-        if not isinstance(raw_item, MutableMapping):
-            self._revert_pending_edit(row, column_index, cell, "Unable to edit this entry.")
-            return
+        column_id = self._column_ids[column_index]
 
-        previous_raw = deepcopy(raw_item)
+        # Unchanged text needs no work at all; bail out before touching the item.
         previous_display = self._pending_items[row]
         old_text = self._format_queue_value(column_id, previous_display, row)
-        new_text = cell.text()
         if new_text == old_text:
             return
 
+        raw_item = self._pending_raw_items[row]
+        if not isinstance(raw_item, MutableMapping):
+            self._revert_pending_edit(row, table_row, column_index, "Unable to edit this entry.")
+            return
+        plan_name = self._extract_plan_name(raw_item)
+        source_key = self._row_kwarg_key(table_row, column_index)
+        target_key = source_key or column_id
+
+        # Edit a copy-on-write clone so the original stays intact for reverts.
+        previous_raw = raw_item
+        raw_item = clone_item(previous_raw)
         if not apply_item_edit(
             raw_item,
             target_key,
@@ -623,20 +1037,22 @@ class QueueMonitorWidget(QWidget):
             plan_name=plan_name,
             plan_definitions=self._plan_definitions,
             roi_key_map=self._roi_key_map,
+            coercers=self._coercer_cache,
         ):
-            self._revert_pending_edit(row, column_index, cell, f"Cannot edit column '{column_id}'.", previous_raw, previous_display, old_text)
+            self._revert_pending_edit(row, table_row, column_index, f"Cannot edit column '{column_id}'.", previous_raw, previous_display, old_text)
             return
 
         # # Update cached display version
+        self._pending_raw_items[row] = raw_item
         self._pending_items[row] = prepare_display_item(raw_item)
-        row_values = self._get_row_values(row + (1 if running_uid != "" else 0))
+        row_values = self._get_row_values(table_row)
 
         api = self._require_queue_api(notify=False)
         if api is None:
             self._revert_pending_edit(
                 row,
+                table_row,
                 column_index,
-                cell,
                 "Queue controller unavailable.",
                 previous_raw,
                 previous_display,
@@ -654,9 +1070,9 @@ class QueueMonitorWidget(QWidget):
             )
         except ValueError as exc:
             self._revert_pending_edit(
-                row + (1 if running_uid != "" else 0),
+                row,
+                table_row,
                 column_index,
-                cell,
                 f"Invalid value: {exc}",
                 previous_raw,
                 previous_display,
@@ -666,13 +1082,13 @@ class QueueMonitorWidget(QWidget):
 
         update_fn = getattr(api, "item_update", None) or getattr(api, "queue_item_update", None)
         if update_fn is None:
-            self._revert_pending_edit(row, column_index, cell, "Queue API does not support updates.", previous_raw, previous_display, old_text)
+            self._revert_pending_edit(row, table_row, column_index, "Queue API does not support updates.", previous_raw, previous_display, old_text)
             return
 
         try:
             response = update_fn(item=payload, replace=False)
         except Exception:
-            self._revert_pending_edit(row, column_index, cell, "Failed to submit queue item update.", previous_raw, previous_display, old_text)
+            self._revert_pending_edit(row, table_row, column_index, "Failed to submit queue item update.", previous_raw, previous_display, old_text)
             return
 
         message = "Queue item updated."
@@ -685,140 +1101,140 @@ class QueueMonitorWidget(QWidget):
             self._set_status_message(message or "Queue item update rejected.")
             self._pending_raw_items[row] = previous_raw
             self._pending_items[row] = previous_display
-            self._restore_cell_from_value(cell, old_text)
+            self._restore_cell_from_value(table_row, column_index, old_text)
             return
 
         self._set_status_message(message)
+        self._last_pending_source = None
         self._refresh_queue_table()
 
     def _revert_pending_edit(
         self,
         row: int,
+        table_row: int,
         column_index: int,
-        cell: QTableWidgetItem,
         message: str,
-        previous_raw: Optional[Mapping[str, Any]] = None,
+        previous_raw: Optional[dict[str, Any]] = None,
         previous_display: Optional[Mapping[str, Any]] = None,
         old_text: Optional[str] = None,
     ) -> None:
         self._set_status_message(message)
         if previous_raw is not None and 0 <= row < len(self._pending_raw_items):
-            self._pending_raw_items[row] = clone_item(previous_raw)
+            self._pending_raw_items[row] = previous_raw
         if previous_display is not None and 0 <= row < len(self._pending_items):
             self._pending_items[row] = prepare_display_item(previous_display)
         if old_text is not None:
-            self._restore_cell_from_value(cell, old_text)
+            self._restore_cell_from_value(table_row, column_index, old_text)
         else:
-            self._restore_cell_from_cache(cell, row, column_index)
+            self._restore_cell_from_cache(table_row, row, column_index)
 
-    def _restore_cell_from_cache(self, cell: QTableWidgetItem, row: int, column_index: int) -> None:
+    def _restore_cell_from_cache(self, table_row: int, row: int, column_index: int) -> None:
         if 0 <= row < len(self._pending_items) and 0 <= column_index < len(self._columns):
-            column_id = self._columns[column_index].column_id
+            column_id = self._column_ids[column_index]
             value = self._format_queue_value(column_id, self._pending_items[row], row)
-            self._restore_cell_from_value(cell, value)
-        else:
-            self._restore_cell_from_value(cell, cell.text())
+            self._restore_cell_from_value(table_row, column_index, value)
 
-    def _restore_cell_from_value(self, cell: QTableWidgetItem, value: str) -> None:
-        self._suppress_item_changed = True
-        self._queue_table.blockSignals(True)
-        try:
-            cell.setText(value)
-        finally:
-            self._queue_table.blockSignals(False)
-            self._suppress_item_changed = False
+    def _restore_cell_from_value(self, table_row: int, column_index: int, value: str) -> None:
+        self._queue_model.set_cell_text(table_row, column_index, value)
 
-    def _plan_parameters_for(self, plan_name: str) -> set[str]:
+    def _plan_parameters_for(self, plan_name: str) -> frozenset[str]:
         plan_name = str(plan_name or "").strip()
-        if not plan_name:
-            return set()
-        cached = self._plan_param_cache.get(plan_name)
-        if cached is not None:
-            return cached
-        controller = self._controller
-        if controller is None:
-            params: set[str] = set()
-        else:
-            try:
-                names = controller.get_plan_parameters_names(name=plan_name)
-            except Exception:
-                names = []
-            params = {str(name) for name in names if isinstance(name, str)}
-        self._plan_param_cache[plan_name] = params
-        return params
+        return self._plan_param_cache.get(plan_name, _NO_PARAMETERS)
 
     def _extract_plan_name(self, item: Mapping[str, Any]) -> str:
-        direct = item.get("name") if isinstance(item, Mapping) else None
+        # Queue items are plain dicts; only fall back to the ABC check otherwise.
+        if type(item) is not dict and not isinstance(item, Mapping):
+            return ""
+        direct = item.get("name")
         if direct:
             return str(direct)
-        extracted = extract_item_field(item, "name") if isinstance(item, Mapping) else None
-        return str(extracted or "")
+        return str(extract_item_field(item, "name") or "")
 
     def _configure_queue_table(self, minimum_section_size: float = 90) -> None:
-        header = self._queue_table.horizontalHeader()
-        header.setStretchLastSection(False)
-        header.setSectionResizeMode(QHeaderView.Stretch)
-        vertical_header = self._queue_table.verticalHeader()
-        vertical_header.setSectionResizeMode(QHeaderView.Stretch)
-        for index, spec in enumerate(self._columns):
-            header_item = self._queue_table.horizontalHeaderItem(index)
-            if header_item is None:
-                header_item = QTableWidgetItem(spec.label)
-                self._queue_table.setHorizontalHeaderItem(index, header_item)
-            else:
-                header_item.setText(spec.label)
-                
-        header.setMinimumSectionSize(minimum_section_size)
-        header.setSectionResizeMode(QHeaderView.Interactive)
-
-    def _ensure_columns(self, queue: Sequence[Mapping[str, Any]]) -> None:
-        required: list[QueueColumnSpec] = []
-        seen: set[str] = set()
-
-        def add(column_id: str, label: str) -> None:
-            if not column_id or column_id in seen:
-                return
-            seen.add(column_id)
-            required.append(QueueColumnSpec(column_id, label, True))
-
-        # Base plan name column
-        add("status", "Status")
-        add("name", "Plan")
-        add("scan_ids", "Scan ID")
+        # Column specs are frozen and ``_columns`` is only ever replaced, so the
+        # last applied tuple compares directly against the current one.
+        columns = self._columns
+        if columns == self._applied_columns:
+            return
+        self._applied_columns = columns
+        table = self._queue_table
+        header = table.horizontalHeader()
+        vertical_header = table.verticalHeader()
+        # Column growth toggles resize modes and inserts sections; repaint once
+        # at the end instead of after each step.
+        table.setUpdatesEnabled(False)
+        try:
+            header.setStretchLastSection(False)
+            header.setSectionResizeMode(QHeaderView.Stretch)
+            vertical_header.setSectionResizeMode(self._row_resize_mode)
+            vertical_header.setDefaultSectionSize(table.fontMetrics().height() + 6)
+            self._queue_model.set_headers([spec.label for spec in self._columns])
+            header.setMinimumSectionSize(minimum_section_size)
+            header.setSectionResizeMode(self._column_resize_mode)
+        finally:
+            table.setUpdatesEnabled(True)
+
+    def _base_columns(self) -> list[QueueColumnSpec]:
+        columns = [
+            QueueColumnSpec("status", "Status", True),
+            QueueColumnSpec("name", "Plan", True),
+            QueueColumnSpec("scan_ids", "Scan ID", True),
+        ]
+        seen = {spec.column_id for spec in columns}
 
         # ROI mapped columns in declared order
+        overrides = self._label_overrides
         for key in self._roi_key_map.keys():
-            if key == "title":
-                label = "Comments"
-            else:   
-                label = key.replace("_", " ").title()
-            add(key, label)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            label = overrides.get(key)
+            if label is None:
+                label = "Comments" if key == "title" else _column_label(key)
+            columns.append(QueueColumnSpec(intern(key), label, True))
+        return columns
+
+    def _ensure_columns(self, queue: Sequence[Mapping[str, Any]]) -> bool:
+        """
+        Append columns for kwargs keys in ``queue`` that are not shown yet.
+
+        Columns are only ever added, so items that were already scanned cost a
+        set lookup per key and the header is reconfigured only on growth.
+        """
+        known = self._known_column_ids
+        add_known = known.add
+        new_columns: list[QueueColumnSpec] = []
+        add_column = new_columns.append
 
         # Dynamically add kwargs keys not already covered by ROI aliases
+        aliases = self._roi_value_aliases
+        overrides = self._label_overrides
         for item in queue:
-            if not isinstance(item, Mapping):
+            if not isinstance(item, dict):
                 continue
-            kwargs_sources: list[Mapping[str, Any]] = []
             kwargs = item.get("kwargs")
-            if isinstance(kwargs, Mapping):
-                kwargs_sources.append(kwargs)
             nested_item = item.get("item")
-            if isinstance(nested_item, Mapping):
-                nested_kwargs = nested_item.get("kwargs")
-                if isinstance(nested_kwargs, Mapping):
-                    kwargs_sources.append(nested_kwargs)
-            for mapping in kwargs_sources:
-                for key in mapping.keys():
-                    if key in self._roi_value_aliases:
+            nested_kwargs = nested_item.get("kwargs") if isinstance(nested_item, dict) else None
+            for mapping in (kwargs, nested_kwargs):
+                if not isinstance(mapping, dict):
+                    continue
+                for key in mapping:
+                    if key in aliases or key in known:
                         continue
-                    label = str(key).replace("_", " ").title()
                     key_str = str(key)
-                    add(key_str, label)
-
-        if len(required) != len(self._columns) or any(a.column_id != b.column_id for a, b in zip(required, self._columns)):
-            self._columns = required
-            self._queue_table.setColumnCount(len(self._columns))
-            self._configure_queue_table()
+                    if not key_str or key_str in known:
+                        continue
+                    # Interned ids compare and hash by identity in the render loop.
+                    key_str = intern(key_str)
+                    add_known(key_str)
+                    add_column(QueueColumnSpec(key_str, overrides.get(key_str) or _column_label(key_str), True))
+
+        if not new_columns:
+            return False
+        self._columns += tuple(new_columns)
+        self._column_ids += tuple(spec.column_id for spec in new_columns)
+        self._configure_queue_table()
+        return True
 
     def _format_queue_value(
         self,
@@ -826,6 +1242,12 @@ class QueueMonitorWidget(QWidget):
         item: Mapping[str, Any],
         row_index: int,
     ) -> str:
+        # Rendered rows already hold their text; only resolve cells never shown.
+        cells = item.get("_cells")
+        if isinstance(cells, dict):
+            cached = cells.get(column_id)
+            if cached is not None:
+                return cached[0]
         text, _ = resolve_queue_value(
             column_id,
             item,
@@ -836,23 +1258,33 @@ class QueueMonitorWidget(QWidget):
         return text
 
     def _get_row_values(self, row: int) -> dict[str, str]:
-        table = self._queue_table
-        if row < 0 or row >= table.rowCount():
+        row_data = self._queue_model.row_at(row)
+        if row_data is None:
             return {}
 
-        values: dict[str, str] = {}
-        for column_index, spec in enumerate(self._columns):
-            item = table.item(row, column_index)
-            key = spec.column_id
-            if item is not None:
-                kw_key = item.data(QUEUE_ITEM_KWARG_KEY_ROLE)
-                if isinstance(kw_key, str) and kw_key:
-                    key = kw_key
-            values[key] = item.text() if item is not None else ""
+        # Cells and kwarg keys come from the model row in one pass; columns added
+        # after the row was rendered have no text yet.
+        column_ids = self._column_ids
+        values = {
+            kwarg_key or column_id: text
+            for column_id, text, kwarg_key in zip(column_ids, row_data.cells, row_data.kwarg_keys)
+        }
+        for column_id in column_ids[len(row_data.cells):]:
+            values[column_id] = ""
         return values
 
+    def _row_kwarg_key(self, row: int, column_index: int) -> Optional[str]:
+        row_data = self._queue_model.row_at(row)
+        if row_data is None:
+            return None
+        kwarg_keys = row_data.kwarg_keys
+        return kwarg_keys[column_index] if column_index < len(kwarg_keys) else None
+
     def _set_status_message(self, message: Optional[str]) -> None:
         text = "" if message is None else str(message)
+        if text == self._last_status_text:
+            return
+        self._last_status_text = text
         self._status_label.setText(text)
 
     @staticmethod
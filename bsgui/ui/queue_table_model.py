@@ -0,0 +1,191 @@
+"""Table model backing the queue monitor view."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from difflib import SequenceMatcher
+from typing import Any, Optional, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt, Signal
+from PySide6.QtGui import QBrush, QFont
+
+from .queue_controls import QUEUE_ITEM_STATE_PENDING
+
+# data() runs for every role of every visible cell on each paint; resolve the
+# role enums once instead of through the Qt namespace on every call.
+_DISPLAY_ROLE = Qt.DisplayRole
+_EDIT_ROLE = Qt.EditRole
+_FOREGROUND_ROLE = Qt.ForegroundRole
+_FONT_ROLE = Qt.FontRole
+
+# Item flags depend only on the row state, so they are composed once.
+_FROZEN_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDropEnabled
+_PENDING_FLAGS = _FROZEN_FLAGS | Qt.ItemIsDragEnabled | Qt.ItemIsEditable
+
+
+@dataclass(frozen=True, slots=True)
+class QueueRow:
+    """Rendered state of a single queue table row."""
+
+    uid: str
+    state: str
+    cells: tuple[str, ...]
+    kwarg_keys: tuple[Optional[str], ...]
+
+
+class QueueTableModel(QAbstractTableModel):
+    """Hold pre-rendered queue rows and expose them to a QTableView."""
+
+    cellEdited = Signal(int, int, str)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._headers: list[str] = []
+        self._rows: list[QueueRow] = []
+        self._state_foreground: dict[str, QBrush] = {}
+        self._state_font: dict[str, QFont] = {}
+
+    # ------------------------------------------------------------------ #
+    # Public API
+
+    def set_headers(self, labels: Sequence[str]) -> None:
+        """Apply column labels; new columns are appended at the end."""
+        labels = list(labels)
+        current = len(self._headers)
+        if len(labels) > current:
+            self.beginInsertColumns(QModelIndex(), current, len(labels) - 1)
+            self._headers = labels
+            self.endInsertColumns()
+        elif len(labels) < current:
+            self.beginRemoveColumns(QModelIndex(), len(labels), current - 1)
+            self._headers = labels
+            self.endRemoveColumns()
+        elif labels != self._headers:
+            self._headers = labels
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(labels) - 1)
+
+    def set_state_style(
+        self,
+        state: str,
+        *,
+        foreground: Optional[QBrush] = None,
+        font: Optional[QFont] = None,
+    ) -> None:
+        if foreground is not None:
+            self._state_foreground[state] = foreground
+        if font is not None:
+            self._state_font[state] = font
+
+    def sync_rows(self, rows: Sequence[QueueRow]) -> None:
+        """
+        Bring the model in line with ``rows``.
+
+        Rows are matched by UID against the current contents; only inserted or
+        removed ranges emit structural signals and only rows whose rendered
+        values differ emit ``dataChanged``.
+        """
+        rows = list(rows)
+        old_uids = [row.uid for row in self._rows]
+        new_uids = [row.uid for row in rows]
+        # Steady state (same rows, values refreshed in place) needs no
+        # structural changes at all, so skip the sequence diff entirely.
+        opcodes = [] if old_uids == new_uids else SequenceMatcher(None, old_uids, new_uids, autojunk=False).get_opcodes()
+        # Apply from the bottom up so earlier row indices stay valid.
+        for tag, start, stop, new_start, new_stop in reversed(opcodes):
+            if tag == "equal":
+                continue
+            old_count = stop - start
+            new_count = new_stop - new_start
+            common = min(old_count, new_count)
+            if old_count > common:
+                self.beginRemoveRows(QModelIndex(), start + common, stop - 1)
+                del self._rows[start + common:stop]
+                self.endRemoveRows()
+            elif new_count > common:
+                self.beginInsertRows(QModelIndex(), start + common, start + new_count - 1)
+                self._rows[start + common:start + common] = rows[new_start + common:new_stop]
+                self.endInsertRows()
+
+        last_column = max(len(self._headers) - 1, 0)
+        changed_start: Optional[int] = None
+        for index, row in enumerate(rows):
+            if self._rows[index] != row:
+                self._rows[index] = row
+                if changed_start is None:
+                    changed_start = index
+                continue
+            if changed_start is not None:
+                self.dataChanged.emit(self.index(changed_start, 0), self.index(index - 1, last_column))
+                changed_start = None
+        if changed_start is not None:
+            self.dataChanged.emit(self.index(changed_start, 0), self.index(len(rows) - 1, last_column))
+
+    def row_at(self, row: int) -> Optional[QueueRow]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def set_cell_text(self, row: int, column: int, text: str) -> None:
+        """Replace the text shown in one cell without reporting an edit."""
+        current = self.row_at(row)
+        if current is None or not 0 <= column < len(current.cells) or current.cells[column] == text:
+            return
+        cells = list(current.cells)
+        cells[column] = text
+        self._rows[row] = replace(current, cells=tuple(cells))
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    # ------------------------------------------------------------------ #
+    # QAbstractTableModel interface
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.DisplayRole,
+    ) -> Any:
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == _DISPLAY_ROLE or role == _EDIT_ROLE:
+            cells = self._rows[index.row()].cells
+            column = index.column()
+            return cells[column] if column < len(cells) else ""
+        # Styles are shared per state, so every styled cell hands out the same
+        # brush/font instance rather than building its own.
+        if role == _FOREGROUND_ROLE:
+            return self._state_foreground.get(self._rows[index.row()].state)
+        if role == _FONT_ROLE:
+            return self._state_font.get(self._rows[index.row()].state)
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.ItemIsDropEnabled
+        if self._rows[index.row()].state == QUEUE_ITEM_STATE_PENDING:
+            return _PENDING_FLAGS
+        return _FROZEN_FLAGS
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:  # noqa: N802
+        if role != Qt.EditRole or not index.isValid() or not self.flags(index) & Qt.ItemIsEditable:
+            return False
+        text = "" if value is None else str(value)
+        row, column = index.row(), index.column()
+        self.set_cell_text(row, column, text)
+        self.cellEdited.emit(row, column, text)
+        return True
+
+    def supportedDragActions(self) -> Qt.DropActions:  # noqa: N802
+        return Qt.MoveAction
+
+    def supportedDropActions(self) -> Qt.DropActions:  # noqa: N802
+        return Qt.MoveAction
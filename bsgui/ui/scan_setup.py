@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import pathlib
+from functools import partial
 from typing import Any, Mapping, Optional, Sequence, Tuple
 
 from PySide6.QtCore import Signal
@@ -64,18 +65,21 @@ class DataVisualizationWidget(QWidget):
             self.show_message("Failed to plot dataset")
             return
 
+        # Plain dicts are passed through as-is; only other mappings are copied
+        # so the payload stays a dict for the datasetChanged signal.
+        md = metadata if isinstance(metadata, dict) else dict(metadata or {})
         payload = {
             "xval": xval,
             "yval": yval,
             "zval": zval,
-            "metadata": dict(metadata) if metadata is not None else {},
+            "metadata": md,
             "path": source_path,
         }
         self._last_payload = payload
 
-        title = payload["metadata"].get("title") if payload["metadata"] else None
-        xlabel = payload["metadata"].get("xlabel", "X")
-        ylabel = payload["metadata"].get("ylabel", "Y")
+        title = md.get("title")
+        xlabel = md.get("xlabel", "X")
+        ylabel = md.get("ylabel", "Y")
 
         if any([xval is None, yval is None, zval is None]):
             self.show_message("Dataset missing 'x' and 'y'")
@@ -139,9 +143,7 @@ class DataViewerPane(QWidget):
 
         for loader_widget, controller in self._loader_entries:
             panel_layout.addWidget(loader_widget)
-            loader_widget.selectionChanged.connect(
-                lambda path, metadata, ctrl=controller: self._handle_selection(ctrl, path, metadata)
-            )
+            loader_widget.selectionChanged.connect(partial(self._handle_selection, controller))
             loader_widget.set_controller(controller)
 
         self._viewer.datasetChanged.connect(self.datasetChanged.emit)
@@ -2,11 +2,50 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, Signal
+import threading
+
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal
+
+# Messages posted within this window collapse into the last one.
+_DEBOUNCE_MS = 50
 
 
 class _StatusBus(QObject):
     message = Signal(str)
+    _flush_requested = Signal()
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pending: str | None = None
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(_DEBOUNCE_MS)
+        self._timer.timeout.connect(self._flush)
+        # Posts may come from worker threads (e.g. logging); the signal hop
+        # makes sure the timer is always started on the bus's own thread.
+        self._flush_requested.connect(self._schedule_flush)
+
+    def post(self, message: str) -> None:
+        if QCoreApplication.instance() is None:
+            # No event loop to debounce on yet; deliver straight away.
+            self.message.emit(message)
+            return
+        with self._lock:
+            self._pending = message
+        # Always request a flush (it is a no-op while the timer runs) so one
+        # failed timer start cannot strand the pending message.
+        self._flush_requested.emit()
+
+    def _schedule_flush(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _flush(self) -> None:
+        with self._lock:
+            message, self._pending = self._pending, None
+        if message is not None:
+            self.message.emit(message)
 
 
 _status_bus: _StatusBus | None = None
@@ -22,4 +61,4 @@ def get_status_bus() -> _StatusBus:
 def emit_status(message: str) -> None:
     if not message:
         return
-    get_status_bus().message.emit(str(message))
+    get_status_bus().post(str(message))
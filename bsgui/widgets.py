@@ -1,37 +1,46 @@
-"""Compatibility shim for the legacy `bsgui.widgets` module."""
-
-from .core import DataLoader, DataVisualizationController, default_loader
-from .ui import (
-    BaseLoaderWidget,
-    CustomToolbar,
-    DataVisualizationWidget,
-    DataViewerPane,
-    PlanDefinition,
-    PlanEditorWidget,
-    PlanParameter,
-    PlotCanvasWidget,
-    PtychographyLoaderWidget,
-    QServerWidget,
-    QueueServerStatusWidget,
-    QServerConsoleWidget,
-    XRFLoaderWidget,
-)
-
-__all__ = [
-    "BaseLoaderWidget",
-    "CustomToolbar",
-    "DataLoader",
-    "DataVisualizationController",
-    "DataVisualizationWidget",
-    "DataViewerPane",
-    "PlanDefinition",
-    "PlanEditorWidget",
-    "PlanParameter",
-    "PlotCanvasWidget",
-    "PtychographyLoaderWidget",
-    "QServerWidget",
-    "QueueServerStatusWidget",
-    "QServerConsoleWidget",
-    "XRFLoaderWidget",
-    "default_loader",
-]
+"""Compatibility shim for the legacy `bsgui.widgets` module.
+
+Names are resolved lazily (PEP 562), so importing the shim only loads the
+modules that actually provide the names a caller uses.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY_EXPORTS = {
+    "BaseLoaderWidget": ("bsgui.ui.data_loader", "BaseLoaderWidget"),
+    "CustomToolbar": ("bsgui.ui.canvas_toolbar", "CustomToolbar"),
+    "DataLoader": ("bsgui.core.data_controller", "DataLoader"),
+    "DataVisualizationController": ("bsgui.core.data_controller", "DataVisualizationController"),
+    "DataVisualizationWidget": ("bsgui.ui.scan_setup", "DataVisualizationWidget"),
+    "DataViewerPane": ("bsgui.ui.scan_setup", "DataViewerPane"),
+    "PlanDefinition": ("bsgui.core.qserver_controller", "PlanDefinition"),
+    "PlanEditorWidget": ("bsgui.ui.plan_editor", "PlanEditorWidget"),
+    "PlanParameter": ("bsgui.core.qserver_controller", "PlanParameter"),
+    "PlotCanvasWidget": ("bsgui.ui.plot_canvas", "PlotCanvasWidget"),
+    "PtychographyLoaderWidget": ("bsgui.ui.data_loader", "PtychographyLoaderWidget"),
+    # Legacy name of the queue monitor widget.
+    "QServerWidget": ("bsgui.ui.queue_monitor", "QueueMonitorWidget"),
+    "QueueServerStatusWidget": ("bsgui.ui.qserver_status", "QueueServerStatusWidget"),
+    "QServerConsoleWidget": ("bsgui.ui.qserver_console", "QServerConsoleWidget"),
+    "XRFLoaderWidget": ("bsgui.ui.data_loader", "XRFLoaderWidget"),
+    "default_loader": ("bsgui.core.data_controller", "default_loader"),
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = target
+    value = getattr(importlib.import_module(module_name), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
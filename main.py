@@ -18,17 +18,30 @@ from bsgui.ui.status_bus import get_status_bus, emit_status
 
 DEFAULT_WIDGET_KEYS = ["scan_setup", "qserver_monitor"]
 
+# PyYAML is imported on first use rather than at module import time.
+_yaml_module = None
+
+
+def _import_yaml():
+    global _yaml_module
+    if _yaml_module is None:
+        try:
+            import yaml
+        except ImportError as exc:  # pragma: no cover - dependency guard
+            raise RuntimeError(
+                "PyYAML is required to load configuration files. Install it with 'pip install PyYAML'."
+            ) from exc
+        _yaml_module = yaml
+    return _yaml_module
+
 
 def load_config(path: pathlib.Path) -> dict:
     """Load YAML configuration from *path*."""
 
-    try:
-        import yaml
-    except ImportError as exc:  # pragma: no cover - dependency guard
-        raise RuntimeError(
-            "PyYAML is required to load configuration files. Install it with 'pip install PyYAML'."
-        ) from exc
+    if path.stat().st_size == 0:
+        return {}
 
+    yaml = _import_yaml()
     with path.open("r", encoding="utf-8") as handle:
         data = yaml.safe_load(handle) or {}
     if not isinstance(data, dict):
@@ -63,17 +76,18 @@ def extract_tab_configs(config: dict, widget_keys: List[str]) -> List[dict]:
     if default_used:
         return tabs
 
+    # tab_by_key is keyed by each tab's own "key", so a hit never needs its key
+    # rewritten; only misses get a fresh stub.
     ordered_tabs = []
     for key in widget_keys:
-        tab = tab_by_key.get(key, {"key": key})
-        if tab.get("key") != key:
-            tab = dict(tab)
-            tab["key"] = key
-        ordered_tabs.append(tab)
+        tab = tab_by_key.get(key)
+        ordered_tabs.append({"key": key} if tab is None else tab)
     return ordered_tabs
 
 
 def extract_widget_options(tab_configs: Sequence[dict], key: str) -> dict:
+    if not tab_configs:
+        return {}
     for tab in tab_configs:
         if tab.get("key") == key:
             options = tab.get("options", {})
@@ -82,7 +96,32 @@ def extract_widget_options(tab_configs: Sequence[dict], key: str) -> dict:
     return {}
 
 
+# (option key, accepted types, converter) for scalar qserver_monitor options.
+_QSERVER_OPTION_SPEC = (
+    ("poll_interval_ms", (int, float), int),
+    ("roi_key_map", Mapping, dict),
+)
+
+
+def build_qserver_kwargs(options: Mapping) -> dict:
+    if not options:
+        return {}
+    kwargs = {
+        key: convert(value)
+        for key, accepted, convert in _QSERVER_OPTION_SPEC
+        if isinstance(value := options.get(key), accepted)
+    }
+    columns = options.get("columns")
+    if isinstance(columns, Sequence):
+        normalized_columns = [dict(entry) for entry in columns if isinstance(entry, Mapping)]
+        if normalized_columns:
+            kwargs["columns"] = normalized_columns
+    return kwargs
+
+
 def parse_app_settings(config: dict) -> tuple[str, Sequence[int], dict]:
+    if not config:
+        return "Beamline Control", (1200, 800), {}
     app_config = config.get("app", {}) if isinstance(config, dict) else {}
     title = app_config.get("title", "Beamline Control")
 
@@ -132,7 +171,7 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.setWindowTitle(window_title)
         self.statusBar().showMessage((status_messages or {}).get("idle", "Ready."))
-        get_status_bus().message.connect(self.statusBar().showMessage)
+        get_status_bus().message.connect(self._show_status_message)
 
         tabs = QTabWidget()
         for tab_config in tab_configs:
@@ -158,6 +197,13 @@ class MainWindow(QMainWindow):
 
         self.setCentralWidget(tabs)
 
+    def _show_status_message(self, message: str) -> None:
+        # Repeated log lines would otherwise repaint the status bar each time.
+        status_bar = self.statusBar()
+        if message == status_bar.currentMessage():
+            return
+        status_bar.showMessage(message)
+
 
 def parse_args(argv: List[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Beamline control GUI")
@@ -196,9 +242,6 @@ def main(argv: List[str]) -> int:
     config = load_config(config_path) if config_path else {}
 
     logging.basicConfig(level=logging.INFO)
-    status_handler = StatusBarLogHandler()
-    status_handler.setLevel(logging.INFO)
-    logging.getLogger().addHandler(status_handler)
 
     tab_configs = extract_tab_configs(config, list(args.widgets))
 
@@ -216,22 +259,7 @@ def main(argv: List[str]) -> int:
                 if isinstance(loader_cfg, dict) and "search_paths" not in loader_cfg:
                     loader_cfg["search_paths"] = data_paths
 
-    qserver_options = extract_widget_options(tab_configs, "qserver_monitor")
-    qserver_kwargs = {}
-    poll_interval = qserver_options.get("poll_interval_ms")
-    if isinstance(poll_interval, (int, float)):
-        qserver_kwargs["poll_interval_ms"] = int(poll_interval)
-    roi_key_map = qserver_options.get("roi_key_map")
-    if isinstance(roi_key_map, Mapping):
-        qserver_kwargs["roi_key_map"] = dict(roi_key_map)
-    columns = qserver_options.get("columns")
-    if isinstance(columns, Sequence):
-        normalized_columns = []
-        for entry in columns:
-            if isinstance(entry, Mapping):
-                normalized_columns.append(dict(entry))
-        if normalized_columns:
-            qserver_kwargs["columns"] = normalized_columns
+    qserver_kwargs = build_qserver_kwargs(extract_widget_options(tab_configs, "qserver_monitor"))
 
     register_default_widgets(
         data_paths=data_paths,
@@ -242,6 +270,11 @@ def main(argv: List[str]) -> int:
     title, window_size, status_messages = parse_app_settings(config)
 
     app = QApplication(sys.argv)
+    # The status bus (and its debounce timer) must live on the GUI thread, so
+    # records are only forwarded once the application exists.
+    status_handler = StatusBarLogHandler()
+    status_handler.setLevel(logging.INFO)
+    logging.getLogger().addHandler(status_handler)
     window = MainWindow(
         tab_configs,
         registry,